@@ -1,24 +1,25 @@
-from datetime import datetime
-
 from sqlalchemy import Column, Integer, String, UniqueConstraint, DateTime, func
 
-from src.sqla.manager.manager import DatabaseManager
-from src.sqla.utils import service
-from src.sqla.utils.base import Base, BaseMixin
+from src.sqlax.depends.sqlac import Base
+from src.sqlax.manager.manager import DatabaseManager
+from src.sqlax.utils import helper
+from src.sqlax.utils.mixin import ModelMixin
 
 urls = ["sqlite:///database.db"]
 db_manager = DatabaseManager(urls)
 
 
-class User(Base, BaseMixin):
+class User(Base, ModelMixin):
     __tablename__ = 'users'
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     username = Column(String(50), nullable=False, unique=True)
     email = Column(String(100), nullable=False, unique=True)
     password = Column(String(256), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Server-side timestamps: the database fills these columns, so bulk inserts
+    # don't pay a Python datetime call plus an extra bound parameter per row.
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
     # 添加唯一约束以确保username和email字段的唯一性
     __table_args__ = (
@@ -37,15 +38,15 @@ def initialize():
 def main():
     initialize()
 
-    db_controller = service.Service(db_manager)
+    db_controller = helper.Controller(obj=db_manager)
     session = db_manager.get_new_session()
 
-    q = service.query_builder(session=session, model_class=User)
+    q = helper.query_builder(session=session, model_class=User)
     print("Empty data ==> ", q.all())
 
-    db_controller.add(model_class=User, data={"username": "admin",
-                                              "email": "admin@domain.com",
-                                              "password": "admin123"})  # Add a row
+    db_controller.insert(model_class=User, data={"username": "admin",
+                                                 "email": "admin@domain.com",
+                                                 "password": "admin123"})  # Add a row
     many_fake_user = [
         {
             "username": "tom",
@@ -58,13 +59,13 @@ def main():
             "password": "jack123"
         }
     ]
-    db_controller.add_all(model_class=User, data=many_fake_user)  # Add many row
-    print(User.quick_find_by(session, "username", "admin"))
-    print(User.quick_find_by(session, "username", ("admin", "jack")))
+    db_controller.bulk_insert(model_class=User, data=many_fake_user)  # Add many row
+    print(User.quick_find_by(session, "username", "admin").all())
+    print(User.quick_find_by(session, "username", ("admin", "jack")).all())
 
-    db_controller.delete_records_by_conditions(User, username="jack")
+    db_controller.delete(User, username="jack")
     update_data = {"password": "123456"}
-    db_controller.update_record_by_conditions(User, update_data, func.lower(User.username).like('t%'))
+    db_controller.update(User, update_data, func.lower(User.username).like('t%'))
 
 
 if __name__ == '__main__':
@@ -19,6 +19,8 @@ class ManagerInterface(metaclass=abc.ABCMeta):
         None
     """
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def get_new_session(self, **kwargs) -> Session:
         pass
@@ -26,3 +28,11 @@ class ManagerInterface(metaclass=abc.ABCMeta):
     @abc.abstractmethod
     def get_engine(self, **kwargs) -> Engine:
         pass
+
+    def remove_session(self) -> None:
+        """
+        Release any session held for the current scope.
+
+        Managers that hand out sessions from a scoped registry override this to
+        discard the thread's session at teardown; the default is a no-op.
+        """
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import logging
+from contextlib import asynccontextmanager
+from itertools import islice
+from typing import Iterable
+from typing import Type, Callable, Any
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.sqlax.errors import exc
+from src.sqlax.manager.async_manager import AsyncDatabaseManager
+
+log = logging.getLogger(__name__)
+
+
+class AsyncController:
+    """
+    Async mirror of `Controller` for IO-bound CRUD paths.
+
+    Methods follow the same managed-session pattern as the sync controller,
+    but run on an `AsyncSession` so queries don't block the event loop.
+    """
+
+    __slots__ = ("_dmi", "_batch_size")
+
+    def __init__(
+            self,
+            *,
+            obj: AsyncDatabaseManager,
+            batch_size: int = 1000
+    ) -> None:
+        self._dmi = obj
+        self._batch_size = batch_size
+
+    @asynccontextmanager
+    async def _get_managed_session(self) -> AsyncSession:
+        """
+        Get a managed SQLAlchemy async session.
+
+        Mirrors `Controller._get_managed_session`: on any exception the session
+        is rolled back and the error re-raised as `DatabaseException`; the
+        session is always closed on exit.
+        """
+        session = await self._dmi.get_new_session()
+        try:
+            yield session
+        except Exception as e:
+            await session.rollback()
+            log.exception("Database operation failed, session rolled back")
+            raise exc.DatabaseException(str(e)) from e
+        finally:
+            await session.close()
+
+    async def execute_within_session(
+            self,
+            do: Callable[[AsyncSession, ...], Any],
+            *args,
+            **kwargs
+    ) -> Any:
+        """
+        Execute an async function within a managed session.
+
+        The provided coroutine function `do` is awaited with the session as its
+        first argument, followed by any additional arguments.
+        """
+        async with self._get_managed_session() as session:
+            return await do(session, *args, **kwargs)
+
+    async def insert(
+            self,
+            model_class: Type[Any],
+            data: dict
+    ):
+        """Insert data into the database"""
+        async with self._get_managed_session() as session:
+            instance = model_class(**data)
+            session.add(instance)
+            await session.commit()
+            session.expunge(instance)
+
+            return instance
+
+    async def bulk_insert(
+            self,
+            model_class,
+            data: Iterable[dict],
+            batch_size: int = None
+    ) -> list[dict]:
+        """
+        Batch Insert Multiple Data
+
+        Same chunked Core-insert strategy as `Controller.bulk_insert`: rows are
+        consumed in `batch_size` chunks, one executemany per chunk, single
+        commit at the end.
+        """
+        batch_size = batch_size or self._batch_size
+        inserted = []
+
+        async with self._get_managed_session() as session:
+            rows = iter(data)
+            while chunk := list(islice(rows, batch_size)):
+                await session.execute(insert(model_class), chunk)
+                inserted.extend(chunk)
+
+            await session.commit()
+
+        return inserted
@@ -1,27 +1,97 @@
 from __future__ import annotations
 
+import io
+import logging
+import threading
 from contextlib import contextmanager
-from typing import List, Optional
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter, methodcaller
+from typing import Iterable, Iterator, List, Optional
 from typing import Type, Callable, Any
 
-from sqlalchemy import Connection
+from sqlalchemy import Connection, LargeBinary, bindparam, delete, func, insert, literal, select, tuple_, update
+from sqlalchemy.dialects import mysql, postgresql, sqlite
 from sqlalchemy.orm import Session, Query
+from sqlalchemy.sql import lambda_stmt
 
 from src.sqlax.errors import exc
 from src.sqlax.manager.base import ManagerInterface
+from src.sqlax.utils.mixin import ModelMixin
+
+__all__ = ["models_to_dict_list", "query_builder", "select_builder", "Controller"]
+
+log = logging.getLogger(__name__)
+
+# Rows per executemany/VALUES batch when the caller doesn't choose one.
+# Sized to each dialect's throughput knee: large enough to amortize the
+# round-trip, small enough to stay clear of its bind-parameter limits.
+_DIALECT_BATCH_SIZES = {
+    "postgresql": 1000,
+    "cockroachdb": 1000,
+    "mysql": 10000,
+    "mariadb": 10000,
+    "sqlite": 500,
+    "mssql": 250,
+}
+_FALLBACK_BATCH_SIZE = 1000
+
+
+def _vectorizable(cls) -> bool:
+    """
+    Whether a model class is safe for the `attrgetter` serialization path.
+
+    True only for `ModelMixin` classes whose `to_dict` is the column-tuple
+    default — either inherited from the mixin or the codegen'd equivalent
+    installed at mapper configuration. A user override means `to_dict` may
+    shape the row (rename, exclude, derive), so those classes must go through
+    the method itself.
+    """
+    if not hasattr(cls, "_column_names"):
+        return False
+
+    to_dict = getattr(cls, "to_dict", None)
+    return to_dict is ModelMixin.to_dict or getattr(to_dict, "_generated", False)
 
 
 def models_to_dict_list(models: List[Any]) -> List[dict]:
     """
     Convert a list of models object to a list of dictionaries.
 
+    For homogeneous lists of `ModelMixin` models that keep the default
+    `to_dict`, all columns of a row are pulled in one C-level `attrgetter`
+    call and assembled with `zip`, skipping the per-row method call and
+    per-column attribute machinery entirely. Mixed-class lists, user `to_dict`
+    overrides and other model types fall back to
+    `map` + `methodcaller("to_dict")`, which still runs the bind-and-call loop
+    in C and honors whatever each class's `to_dict` returns.
+
     Example:
         ```python
         data = [Model(...), Model(...), ...]
         result = models_to_dict_list(data)
         ```
     """
-    return [obj.to_dict() for obj in models]
+    if not isinstance(models, (list, tuple)):
+        # ScalarResult from quick_find_by, Query objects, generators: drain
+        # once so the fast-path checks below can index and measure.
+        models = list(models)
+
+    if len(models) == 0:
+        return []
+
+    cls = type(models[0])
+    if not _vectorizable(cls) or any(type(model) is not cls for model in models):
+        return list(map(methodcaller("to_dict"), models))
+
+    names = cls._column_names()
+    if len(names) == 1:
+        # attrgetter with one name returns a scalar, not a 1-tuple.
+        name = names[0]
+        return [{name: value} for value in map(attrgetter(name), models)]
+
+    getter = attrgetter(*names)
+    return [dict(zip(names, getter(model))) for model in models]
 
 
 def query_builder(
@@ -55,22 +125,131 @@ def query_builder(
         ```
     """
     query = session.query(model_class)
-    if conditions:
-        query = query.filter(*conditions)
 
+    # Equality-only is the dominant call shape from the write methods; return
+    # as soon as the applicable filters are attached instead of always running
+    # both conditional branches.
+    if not conditions:
+        return query.filter_by(**equality_conditions) if equality_conditions else query
+
+    query = query.filter(*conditions)
+
+    return query.filter_by(**equality_conditions) if equality_conditions else query
+
+
+def _normalize_conditions(
+        model_class: Type[Any],
+        conditions: tuple,
+        equality_conditions: dict
+) -> tuple:
+    """
+    Fold equality kwargs into column expressions appended to `conditions`.
+
+    Producing one flat expression tuple keeps the statement structure identical
+    regardless of how the caller mixed positional and keyword filters, so the
+    compiled-statement cache is keyed on one shape instead of several.
+    """
     if equality_conditions:
-        query = query.filter_by(**equality_conditions)
+        conditions += tuple(getattr(model_class, key) == value for key, value in equality_conditions.items())
+
+    return conditions
+
+
+@lru_cache(maxsize=256)
+def _equality_select(
+        model_class: Type[Any],
+        eq_keys: tuple
+):
+    """
+    Select statement for an equality-only filter shape, built once per
+    `(model_class, eq_keys)`.
+
+    Values are left as `bindparam`s, so repeat calls with the same shape reuse
+    the memoized statement object (and its compiled-cache entry) and only the
+    parameter dict changes at execute time. This covers the hottest read shape
+    — a handful of `column == value` filters — without rebuilding the
+    expression tree per call; mixed or arbitrary conditions go through
+    `select_builder` instead.
+    """
+    stmt = select(model_class)
+    if eq_keys:
+        stmt = stmt.where(*(getattr(model_class, key) == bindparam(key) for key in eq_keys))
+
+    return stmt
+
+
+def select_builder(
+        model_class: Type[Any],
+        *conditions,
+        **equality_conditions
+):
+    """
+    Build a cached SQLAlchemy select statement.
+
+    This is the `lambda_stmt` counterpart of `query_builder` for hot read paths:
+    the statement construction and SQL compilation are cached keyed on the lambda
+    identity, so repeat invocations with the same condition shape skip the ORM
+    compile step and only swap bound parameter values. Equality conditions are
+    normalized to column expressions before entering the lambda. The resulting
+    statement is executed with `session.execute(...)` / `session.scalars(...)`.
+
+    Args:
+        model_class (Type[Any]): The SQLAlchemy model class representing the table.
+        *conditions: Variable length arguments representing conditions to filter the records.
+        **equality_conditions: Keyword arguments representing equality conditions to filter the records.
+
+    Returns:
+        sqlalchemy.sql.lambdas.StatementLambdaElement: The cached select statement.
+
+    Example:
+        ```python
+        session = get_session()
+        users = session.scalars(select_builder(User, User.age > 30, name="John")).all()
+        ```
+    """
+    stmt = lambda_stmt(lambda: select(model_class))
+    conditions = _normalize_conditions(model_class, conditions, equality_conditions)
+
+    if conditions:
+        stmt += lambda s: s.where(*conditions)
 
-    return query
+    return stmt
 
 
 class Controller:
+    __slots__ = ("_dmi", "_batch_size", "_scope_state")
+
     def __init__(
             self,
             *,
-            obj: ManagerInterface
+            obj: ManagerInterface,
+            batch_size: int = None
     ) -> None:
         self._dmi = obj
+        # None defers the choice to _DIALECT_BATCH_SIZES at execution time,
+        # once the session's dialect is known.
+        self._batch_size = batch_size
+        # Thread-local so a controller shared across threads keeps one open
+        # session_scope per thread instead of cross-wiring them.
+        self._scope_state = threading.local()
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _resolve_validator(
+            model_class: Type[Any],
+            validate_name: str
+    ) -> Callable[[], Any]:
+        """
+        Resolve a model's validator callable, memoized per (class, name).
+
+        Folds the hasattr probe and getattr walk into one lookup done once per
+        pair, so hot validation loops pay a cache hit instead of two attribute
+        traversals per call.
+        """
+        if (validator := getattr(model_class, validate_name, None)) is None:
+            raise NotImplementedError(f"{model_class.__name__}.{validate_name} is not implemented")
+
+        return validator
 
     @staticmethod
     def validate(
@@ -78,28 +257,83 @@ class Controller:
             validate_name: str
     ) -> bool:
         """Validate the specified model"""
-        if not hasattr(model_class, validate_name):
-            raise NotImplementedError(f"{model_class.__name__}.{validate_name} is not implemented")
-
-        if not (validation_errors := getattr(model_class, validate_name)()):
+        if not (validation_errors := Controller._resolve_validator(model_class, validate_name)()):
             return True
 
-        print("Validation errors:")
         for error in validation_errors:
-            print("- ", error)
+            log.error("Validation error: %s", error)
 
         return False
 
+    def _effective_batch_size(
+            self,
+            session: Session,
+            batch_size: int
+    ) -> int:
+        """
+        Resolve the batch size for a bulk statement.
+
+        An explicit per-call or per-controller value wins; otherwise the
+        dialect's sweet-spot default from `_DIALECT_BATCH_SIZES` is used.
+        """
+        if explicit := batch_size or self._batch_size:
+            return explicit
+
+        return _DIALECT_BATCH_SIZES.get(session.get_bind().dialect.name, _FALLBACK_BATCH_SIZE)
+
+    @contextmanager
+    def session_scope(self) -> Session:
+        """
+        Hold one session open across several controller operations.
+
+        Every controller call inside the scope reuses this session instead of
+        opening its own (one pool checkout for the whole burst), and runs in a
+        SAVEPOINT so a failing operation rolls back alone. The batch commits
+        once at scope exit; any escaping exception rolls the whole batch back.
+
+        Example:
+            ```python
+            with controller.session_scope():
+                controller.insert(User, {...})
+                controller.update(User, {...}, User.id == 1)
+            ```
+        """
+        session = self._dmi.get_new_session()
+        self._scope_state.session = session
+        try:
+            yield session
+            session.commit()
+        except exc.DatabaseException:
+            session.rollback()
+            raise
+        except Exception as e:
+            session.rollback()
+            log.exception("Batched database operations failed, session rolled back")
+            raise exc.DatabaseException(str(e)) from e
+        finally:
+            self._scope_state.session = None
+            session.close()
+            self._dmi.remove_session()
+
     @contextmanager
     def _get_managed_session(self) -> Session:
         """
         Get a managed SQLAlchemy session.
 
         This context manager function returns a managed SQLAlchemy session obtained from the `ManagerInterface`.
-        Within the context, the session is yielded to the caller.
+        Within the context, the session is yielded to the caller; on clean exit the
+        transaction is committed.
         If an exception occurs during the execution of the context, the session is rolled back and a `DatabaseException` is raised.
         Finally, the session is closed.
 
+        Inside a `session_scope`, the scope's session is reused instead — the
+        operation runs in a SAVEPOINT released on success, so no extra pool
+        checkout or Session allocation happens and the outer batch stays intact.
+        The same applies when the scoped registry hands back a session the
+        caller is already using (it has a transaction in progress): the
+        operation runs as a SAVEPOINT and commit/close stay with the owner, so
+        the caller's in-flight work is never committed behind their back.
+
         Returns:
             sqlalchemy.orm.Session: The managed SQLAlchemy session.
 
@@ -112,19 +346,59 @@ class Controller:
                 # Perform database operations using the session
             ```
         """
-        session = self._dmi.get_new_session()
+        outer = getattr(self._scope_state, "session", None)
+        if outer is None:
+            session = self._dmi.get_new_session()
+            if session.in_transaction():
+                # The registry returned the thread's session while its owner
+                # is mid-transaction; treat it like a scope session.
+                outer = session
+
+        if outer is not None:
+            nested = outer.begin_nested()
+            try:
+                yield outer
+                nested.commit()
+            except Exception as e:
+                nested.rollback()
+                log.exception("Database operation failed, savepoint rolled back")
+                raise exc.DatabaseException(str(e)) from e
+            return
+
         try:
             yield session
+            session.commit()
         except Exception as e:
             session.rollback()
-            raise exc.DatabaseException(e) from e
+            log.exception("Database operation failed, session rolled back")
+            raise exc.DatabaseException(str(e)) from e
         finally:
             session.close()
+            # Scoped managers also drop the thread's registry entry here, so
+            # the next context starts from a clean session.
+            self._dmi.remove_session()
+
+    @contextmanager
+    def _session_or(self, session: Optional[Session]) -> Session:
+        """
+        Yield the caller's session when given, else open a managed one.
+
+        Read methods accept an external session so callers making bursts of
+        small lookups can amortize one pool checkout across all of them;
+        commit/rollback/close then stay with the owner of that session.
+        """
+        if session is not None:
+            yield session
+            return
+
+        with self._get_managed_session() as managed:
+            yield managed
 
     def execute_within_connect(
             self,
             do: Callable[[Connection, ...], Any],
             *args,
+            batch: int = None,
             **kwargs
     ) -> Any:
         """
@@ -135,9 +409,18 @@ class Controller:
         along with any additional arguments and keyword arguments.
         The result of the function execution is returned.
 
+        Pass `batch=N` for read-heavy callbacks: the connection is then
+        configured for server-side cursors (`stream_results` + `yield_per=N`),
+        so results arrive in batches of N rows as the callback iterates them
+        instead of being buffered in full — the same knob `quick_find_by`
+        exposes. Note that streamed results must be consumed before `do`
+        returns, as the connection closes on exit.
+
         Args:
             do (Callable[[Connection, ...], ...]): A function that takes a database connection as the first argument and performs database operations.
             *args: Variable length arguments to be passed to the `do` function.
+            batch (int, optional): Rows per server-side cursor fetch; None
+                keeps the default buffered results.
             **kwargs: Keyword arguments to be passed to the `do` function.
 
         Returns:
@@ -147,6 +430,34 @@ class Controller:
             None
         """
         with self._dmi.get_engine().connect() as conn:
+            if batch:
+                conn = conn.execution_options(stream_results=True, yield_per=batch)
+
+            return do(conn, *args, **kwargs)
+
+    def execute_within_transaction(
+            self,
+            do: Callable[[Connection, ...], Any],
+            *args,
+            **kwargs
+    ) -> Any:
+        """
+        Execute a function within a connection-level transaction.
+
+        Like `execute_within_connect`, but the connection is opened with
+        `Engine.begin()`: everything `do` executes shares one transaction that
+        commits when the callback returns and rolls back if it raises. Bulk
+        writers get a single commit instead of autocommit-per-statement.
+
+        Example:
+            ```python
+            def load(conn, rows):
+                conn.execute(table.insert(), rows)
+
+            controller.execute_within_transaction(load, rows)
+            ```
+        """
+        with self._dmi.get_engine().begin() as conn:
             return do(conn, *args, **kwargs)
 
     def execute_within_session(
@@ -195,36 +506,227 @@ class Controller:
         with self._get_managed_session() as session:
             instance = model_class(**data)
             session.add(instance)
-            session.commit()
+            session.flush()
+            # Detach before the managed session commits and closes so the
+            # caller can read attributes without an expire/reattach round-trip.
+            session.expunge(instance)
 
             return instance
 
     def bulk_insert(
             self,
             model_class,
-            data: list[dict]
+            data: Iterable[dict],
+            batch_size: int = None,
+            return_defaults: bool = False
     ) -> list[dict]:
-        """Batch Insert Multiple Data"""
-        record_dicts = []
+        """
+        Batch Insert Multiple Data
+
+        Rows are inserted with a Core `insert()` statement, so the driver can use
+        `executemany`/multi-row VALUES batching instead of one round-trip per row,
+        and no ORM instances are built just to be converted back to dicts.
+
+        `data` may be any iterable (including a generator); it is consumed in
+        chunks of `batch_size` rows so the statement parameter count stays within
+        dialect limits (e.g. SQLite's variable cap) and the working set stays
+        bounded. All chunks run in a single transaction with one commit at the end.
+
+        List inputs are returned as-is rather than copied into a second list,
+        so the bulk path holds no duplicate of the payload in memory.
+
+        Args:
+            model_class: The SQLAlchemy model class representing the table.
+            data (Iterable[dict]): The rows to insert.
+            batch_size (int, optional): Rows per executemany batch. Defaults to
+                the value passed to the `Controller` constructor, or to the
+                dialect-specific size from `_DIALECT_BATCH_SIZES` when neither
+                is given.
+            return_defaults (bool): If True, fetch generated primary keys via
+                INSERT ... RETURNING and merge them into the row dicts in place.
+                Requires a dialect with multi-row RETURNING support.
+        """
+        inserted = data if isinstance(data, list) else []
 
         with self._get_managed_session() as session:
-            instances = [model_class(**row) for row in data]
-            session.add_all(instances)
-            session.commit()
+            if self._can_copy_insert(session, model_class, data, return_defaults):
+                self._copy_insert(session, model_class, data)
+                return inserted
+
+            batch_size = self._effective_batch_size(session, batch_size)
+            rows = iter(data)
+            while chunk := list(islice(rows, batch_size)):
+                self._execute_insert_chunk(session, model_class, chunk, return_defaults)
+
+                if inserted is not data:
+                    inserted.extend(chunk)
+
+        return inserted
+
+    # Payload size from which COPY beats batched INSERT ... VALUES on
+    # PostgreSQL; below it the COPY setup cost isn't worth skipping.
+    _COPY_MIN_ROWS = 10000
+
+    @classmethod
+    def _can_copy_insert(
+            cls,
+            session: Session,
+            model_class: Type[Any],
+            data: Iterable[dict],
+            return_defaults: bool
+    ) -> bool:
+        """Whether this payload qualifies for the PostgreSQL COPY fast path."""
+        if return_defaults or not isinstance(data, list) or len(data) < cls._COPY_MIN_ROWS:
+            return False
+
+        dialect = session.get_bind().dialect
+        if dialect.name != "postgresql" or dialect.driver != "psycopg2":
+            return False
+
+        # Binary columns bind to driver buffer objects with no text form;
+        # those payloads stay on the executemany path.
+        table_columns = model_class.__table__.columns
+        return not any(
+            isinstance(table_columns[name].type, LargeBinary)
+            for name in data[0] if name in table_columns
+        )
 
-            record_dicts.extend(instance.to_dict() for instance in instances)
+    @staticmethod
+    def _copy_escape(value) -> str:
+        """Escape one field for COPY text format; None becomes the NULL marker."""
+        if value is None:
+            return "\\N"
+
+        return (
+            str(value)
+            .replace("\\", "\\\\")
+            .replace("\t", "\\t")
+            .replace("\n", "\\n")
+            .replace("\r", "\\r")
+        )
+
+    @classmethod
+    def _copy_insert(
+            cls,
+            session: Session,
+            model_class: Type[Any],
+            data: list[dict]
+    ) -> None:
+        """
+        Stream rows into PostgreSQL with `COPY ... FROM STDIN`.
+
+        COPY bypasses the per-row SQL parse/plan entirely, which is roughly
+        5-10x faster than even batched INSERT for payloads this size. Each
+        value first runs through its column type's bind processor (JSON
+        serialization, Enum to database value, and so on) and is then escaped
+        for COPY's text format — whose backslash escaping also keeps a literal
+        `"\\N"` string distinct from the NULL marker. The column list is taken
+        from the first row; missing keys in later rows are written as NULL.
+        """
+        dialect = session.get_bind().dialect
+        table = model_class.__table__
+        columns = list(data[0])
+        processors = [table.columns[name].type.bind_processor(dialect) for name in columns]
+
+        escape = cls._copy_escape
+        buffer = io.StringIO()
+        write = buffer.write
+        for row in data:
+            fields = []
+            for name, processor in zip(columns, processors):
+                value = row.get(name)
+                if value is not None and processor is not None:
+                    value = processor(value)
+                fields.append(escape(value))
+            write("\t".join(fields))
+            write("\n")
+        buffer.seek(0)
+
+        preparer = dialect.identifier_preparer
+        table_name = preparer.format_table(table)
+        column_list = ", ".join(preparer.quote(name) for name in columns)
+
+        cursor = session.connection().connection.cursor()
+        try:
+            cursor.copy_expert(f"COPY {table_name} ({column_list}) FROM STDIN", buffer)
+        finally:
+            cursor.close()
+
+    def bulk_insert_iter(
+            self,
+            model_class,
+            data: Iterable[dict],
+            batch_size: int = None,
+            return_defaults: bool = False
+    ) -> Iterator[dict]:
+        """
+        Generator variant of `bulk_insert`.
 
-        return record_dicts
+        Rows are inserted chunk by chunk and yielded back as each chunk lands,
+        so neither the input nor the result is ever held in full — peak memory
+        stays O(batch_size) even when `data` is a generator over millions of
+        rows. With `return_defaults=True` the yielded dicts carry the generated
+        primary keys.
+
+        The generator must be consumed to completion for the transaction to
+        commit; abandoning it mid-way rolls the pending work back when the
+        underlying session closes.
+
+        Example:
+            ```python
+            for row in controller.bulk_insert_iter(User, rows_from_file(path)):
+                ...
+            ```
+        """
+        with self._get_managed_session() as session:
+            batch_size = self._effective_batch_size(session, batch_size)
+            rows = iter(data)
+            while chunk := list(islice(rows, batch_size)):
+                self._execute_insert_chunk(session, model_class, chunk, return_defaults)
+                yield from chunk
+
+    @staticmethod
+    def _execute_insert_chunk(
+            session: Session,
+            model_class: Type[Any],
+            chunk: list[dict],
+            return_defaults: bool
+    ) -> None:
+        """
+        Run one Core executemany insert for a chunk of row dicts.
+
+        With `return_defaults`, generated primary keys are fetched via
+        INSERT ... RETURNING and merged into the chunk's dicts in place.
+        """
+        if return_defaults:
+            pk_columns = model_class.__table__.primary_key.columns
+            result = session.execute(
+                insert(model_class).returning(*pk_columns, sort_by_parameter_order=True),
+                chunk
+            )
+            for row, pk_row in zip(chunk, result):
+                row.update(pk_row._mapping)
+        else:
+            session.execute(insert(model_class), chunk)
 
     def upsert(
             self,
             model_class: Type[Any],
             data: list[dict],
-            conflict_target: list[str]
+            conflict_target: list[str],
+            batch_size: int = None
     ) -> None:
         """
         Insert data, update if data already exists
 
+        On dialects with a native upsert — `ON CONFLICT DO UPDATE` (PostgreSQL,
+        CockroachDB, SQLite) or `ON DUPLICATE KEY UPDATE` (MySQL/MariaDB) —
+        rows are upserted with one multi-row statement per `batch_size` chunk:
+        one round-trip per batch instead of a SELECT + INSERT/UPDATE pair per
+        row. Other dialects fall back to the per-row path. Note that MySQL
+        resolves conflicts on any unique key, so `conflict_target` only
+        controls which columns are updated there.
+
         Example:
             ```python
             # Upsert multiple records into the "User" table based on the "email" column as the conflict target
@@ -238,76 +740,194 @@ class Controller:
             ```
         """
         with self._get_managed_session() as session:
-            for row in data:
-                c = [getattr(model_class, column) == row[column] for column in conflict_target]
-                query = session.query(model_class).filter(*c)
-
-                if existing_record := query.first():
-                    for column, value in row.items():
-                        setattr(existing_record, column, value)
-                    session.add(existing_record)
-                else:
-                    instance = model_class(**row)
-                    session.add(instance)
+            batch_size = self._effective_batch_size(session, batch_size)
+            dialect = session.get_bind().dialect.name
+            insert_fn = {
+                "postgresql": postgresql.insert,
+                "cockroachdb": postgresql.insert,
+                "sqlite": sqlite.insert,
+                "mysql": mysql.insert,
+                "mariadb": mysql.insert,
+            }.get(dialect)
+
+            if insert_fn is None:
+                self._upsert_per_row(session, model_class, data, conflict_target)
+            else:
+                rows = iter(data)
+                while chunk := list(islice(rows, batch_size)):
+                    stmt = insert_fn(model_class).values(chunk)
+                    # Insert-if-absent payloads (every column is a conflict
+                    # target) leave nothing to update; conflicts are then
+                    # skipped instead of feeding an empty SET clause.
+                    if insert_fn is mysql.insert:
+                        set_ = {column: stmt.inserted[column] for column in chunk[0] if column not in conflict_target}
+                        stmt = stmt.on_duplicate_key_update(**set_) if set_ else stmt.prefix_with("IGNORE")
+                    else:
+                        set_ = {column: stmt.excluded[column] for column in chunk[0] if column not in conflict_target}
+                        if set_:
+                            stmt = stmt.on_conflict_do_update(index_elements=conflict_target, set_=set_)
+                        else:
+                            stmt = stmt.on_conflict_do_nothing(index_elements=conflict_target)
+                    session.execute(stmt)
+
+    # Conflict keys per prefetch SELECT in the fallback upsert; conservative
+    # enough for every dialect's bind-parameter limit.
+    _UPSERT_PREFETCH_SIZE = 500
+
+    @classmethod
+    def _upsert_per_row(
+            cls,
+            session: Session,
+            model_class: Type[Any],
+            data: list[dict],
+            conflict_target: list[str]
+    ) -> None:
+        """
+        Upsert fallback for dialects without native ON CONFLICT.
 
-            session.commit()
+        Instead of probing the table once per row, all potentially colliding
+        rows are prefetched with `WHERE <conflict cols> IN (...)` SELECTs —
+        one round-trip per `_UPSERT_PREFETCH_SIZE` keys — into a dict keyed on
+        the conflict-target values, and the insert-or-update branch is decided
+        in memory.
+        """
+        columns = [getattr(model_class, name) for name in conflict_target]
+        keys = [tuple(row[name] for name in conflict_target) for row in data]
+
+        if len(columns) == 1:
+            key_expr, in_values = columns[0], [key[0] for key in keys]
+        else:
+            key_expr, in_values = tuple_(*columns), keys
+
+        existing = {}
+        values = iter(in_values)
+        while chunk := list(islice(values, cls._UPSERT_PREFETCH_SIZE)):
+            for record in session.scalars(select(model_class).where(key_expr.in_(chunk))):
+                existing[tuple(getattr(record, name) for name in conflict_target)] = record
+
+        for row, key in zip(data, keys):
+            if existing_record := existing.get(key):
+                # Already attached to the session — change tracking picks up
+                # the setattr writes, so no re-add is needed.
+                for column, value in row.items():
+                    setattr(existing_record, column, value)
+            else:
+                instance = model_class(**row)
+                session.add(instance)
+                # Register the pending instance under its conflict key so a
+                # duplicate later in the payload updates it instead of adding
+                # a second insert that would violate the constraint at flush.
+                existing[key] = instance
 
     def update(
             self,
             model_class: Type[Any],
             data: dict,
             *conditions,
+            synchronize_session=False,
             **equality_conditions
     ) -> None:
-        """Update specified records"""
+        """
+        Update specified records
+
+        Issues a Core UPDATE with `synchronize_session=False` by default, so the
+        statement goes straight to the database without the ORM evaluating every
+        in-session object against the WHERE clause. Callers holding live
+        instances of affected rows should `expire_all()` afterwards, or pass
+        `synchronize_session='fetch'`.
+        """
         with self._get_managed_session() as session:
-            query = query_builder(session, model_class, *conditions, **equality_conditions)
-            query.update(data)
-            session.commit()
+            stmt = update(model_class).values(**data)
+            if conditions := _normalize_conditions(model_class, conditions, equality_conditions):
+                stmt = stmt.where(*conditions)
+
+            session.execute(stmt, execution_options={"synchronize_session": synchronize_session})
 
     def delete(
             self,
             model_class: Type[Any],
             *conditions,
+            synchronize_session=False,
             **equality_conditions
     ) -> None:
-        """Delete records from the database"""
+        """
+        Delete records from the database
+
+        Issues a Core DELETE with `synchronize_session=False` by default, so
+        the statement goes straight to the database — no hidden SELECT to load
+        matching rows into the session first. Callers holding live instances
+        of the affected rows should `expire_all()` afterwards, or pass
+        `synchronize_session='fetch'`.
+        """
         with self._get_managed_session() as session:
-            query = query_builder(session, model_class, *conditions, **equality_conditions)
-            query.delete()
-            session.commit()
+            stmt = delete(model_class)
+            if conditions := _normalize_conditions(model_class, conditions, equality_conditions):
+                stmt = stmt.where(*conditions)
+
+            session.execute(stmt, execution_options={"synchronize_session": synchronize_session})
 
     def find_by_property(
             self,
             model_class: Type[Any],
             property_name: str,
             value: Any,
-            all_=False
+            all_=False,
+            session: Session = None
     ) -> Optional[Any]:
-        """Find a record by a specific property value"""
-        with self._get_managed_session() as session:
-            query = session.query(model_class).filter(getattr(model_class, property_name) == value)
-            return query.all() if all_ else query.first()
+        """
+        Find a record by a specific property value
+
+        Single-record lookups carry `LIMIT 1` into the SQL, so the database
+        stops at the first match instead of the driver discarding surplus rows
+        client-side.
+        """
+        with self._session_or(session) as session:
+            stmt = _equality_select(model_class, (property_name,))
+            params = {property_name: value}
+            if all_:
+                return session.scalars(stmt, params).all()
+
+            return session.execute(stmt.limit(1), params).scalar_one_or_none()
 
     def exists(
             self,
             model_class: Type[Any],
             *conditions,
+            session: Session = None,
             **equality_conditions
     ) -> bool:
-        """Check if specified record exists"""
-        with self._get_managed_session() as session:
-            query = query_builder(session, model_class, *conditions, **equality_conditions)
-            result = session.query(query.exists()).scalar()
-            return bool(result)
+        """
+        Check if specified record exists
+
+        Compiles to a flat `SELECT 1 ... LIMIT 1` instead of wrapping an ORM
+        query in an EXISTS subquery — one statement, no subquery plan node,
+        and the database stops at the first matching row. Pass `session=` to
+        run many checks on one checkout (e.g. polling loops).
+        """
+        with self._session_or(session) as session:
+            stmt = select(literal(1)).select_from(model_class)
+            if conditions := _normalize_conditions(model_class, conditions, equality_conditions):
+                stmt = stmt.where(*conditions)
+
+            return session.execute(stmt.limit(1)).scalar() is not None
 
     def count(
             self,
             model_class: Type[Any],
             *conditions,
+            session: Session = None,
             **equality_conditions
     ) -> int:
-        """Count the number of records matching the specified conditions"""
-        with self._get_managed_session() as session:
-            query = query_builder(session, model_class, *conditions, **equality_conditions)
-            return query.count()
+        """
+        Count the number of records matching the specified conditions
+
+        Emits a flat `SELECT COUNT(*) FROM t WHERE ...` instead of
+        `Query.count()`'s `SELECT count(*) FROM (SELECT ...)` wrapping, so the
+        planner sees the aggregate directly and can use an index-only scan.
+        """
+        with self._session_or(session) as session:
+            stmt = select(func.count()).select_from(model_class)
+            if conditions := _normalize_conditions(model_class, conditions, equality_conditions):
+                stmt = stmt.where(*conditions)
+
+            return session.execute(stmt).scalar_one()
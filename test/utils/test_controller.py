@@ -0,0 +1,73 @@
+import pytest
+from sqlalchemy import create_engine, Column, Integer, String
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import sessionmaker
+
+from src.sqlax.errors import exc
+from src.sqlax.manager.manager import DatabaseManager
+from src.sqlax.utils.helper import Controller
+
+# Setup for the tests: create an in-memory SQLite database and a dummy model
+engine = create_engine('sqlite://')
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+Base = declarative_base()
+
+
+class Item(Base):
+    __tablename__ = 'item'
+    id = Column(Integer, primary_key=True)
+    email = Column(String, unique=True)
+    name = Column(String)
+
+
+# Create the table
+Base.metadata.create_all(bind=engine)
+
+
+def test_upsert_per_row_update_branch_marks_dirty():
+    # Arrange
+    session = SessionLocal()
+    session.add(Item(email='a@x', name='old'))
+    session.commit()
+
+    # Act
+    Controller._upsert_per_row(session, Item, [{'email': 'a@x', 'name': 'new'}], ['email'])
+
+    # Assert: without session.add, change tracking alone must flag the
+    # attached instance pre-commit and the update must still land
+    dirty = list(session.dirty)
+    assert len(dirty) == 1
+    assert dirty[0].name == 'new'
+
+    session.commit()
+    assert session.query(Item).filter_by(email='a@x').one().name == 'new'
+
+
+def test_upsert_per_row_insert_branch_adds_new_instance():
+    # Arrange
+    session = SessionLocal()
+
+    # Act
+    Controller._upsert_per_row(session, Item, [{'email': 'b@x', 'name': 'b'}], ['email'])
+
+    # Assert
+    assert len(session.new) == 1
+
+    session.commit()
+    assert session.query(Item).filter_by(email='b@x').one().name == 'b'
+
+
+def test_session_scope_rolls_back_on_error():
+    # Arrange: a manager-built engine, so the pysqlite BEGIN workaround applies
+    dm = DatabaseManager(['sqlite://'])
+    Base.metadata.create_all(dm.get_engine())
+    controller = Controller(obj=dm)
+
+    # Act: the scope body fails after an insert
+    with pytest.raises(exc.DatabaseException):
+        with controller.session_scope():
+            controller.insert(Item, {'email': 'scoped@x', 'name': 'scoped'})
+            raise RuntimeError('boom')
+
+    # Assert: the whole batch rolled back, nothing was committed
+    assert controller.count(Item, email='scoped@x') == 0
@@ -106,3 +106,16 @@ def test_to_dict():
 
     # Assert
     assert result == {'id': dummy.id, 'name': 'Tom', 'age': 21}
+
+
+def test_update_from_dict():
+    # Arrange
+    dummy = DummyModel(name='Tom', age=21)
+
+    # Act
+    dummy.update_from_dict({'name': 'Jerry', 'age': 22, 'unknown_key': 'ignored'})
+
+    # Assert
+    assert dummy.name == 'Jerry'
+    assert dummy.age == 22
+    assert not hasattr(dummy, 'unknown_key')